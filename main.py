@@ -1,15 +1,30 @@
 import configparser
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
 import pandas as pd
 import numpy as np
-from shapely.geometry import LineString, Point
 import math
 import time
 from datetime import datetime, timedelta
 import logging
+import atexit
+import matplotlib
 import matplotlib.pyplot as plt
 import os
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# orjson parses the API answer faster, but is optional
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Plots are only saved to files, also from worker processes
+matplotlib.use("Agg")
 
 config = configparser.ConfigParser()
 config.read("config.ini")
@@ -29,12 +44,54 @@ MAX_ALT = int(config["altitude"]["max_alt"])
 
 DELAY = 20  # seconds
 
-RECORDS_FILE = "records.csv"
+RECORDS_DIR = "records"
 TURNS_FILE = "turns.csv"
 PLOTS_DIR = "aircraft_plots"
 
-# Create directory for plots if it doesn't exist
-os.makedirs(PLOTS_DIR, exist_ok=True)
+# Columns of the records files and their types in memory
+RECORDS_DTYPES = {
+    "timestamp": "datetime64[s]",
+    "callsign": object,
+    "regis": object,
+    "hex": object,
+    "alt": "Int32",
+    # float64: the turn points and the 1°/3° track thresholds are
+    # computed from these columns
+    "lat": "float64",
+    "lon": "float64",
+    "track": "float64",
+}
+
+# Records are appended to one file per hour in RECORDS_DIR.
+# An aircraft is processed once its first record is 1 hour old, so files
+# older than RECORDS_RETENTION only hold processed records and are deleted
+RECORDS_RETENTION = timedelta(hours=2)
+
+# Rows not processed yet of each aircraft, keyed by hex, in polling order:
+# records files are only written, never read back
+aircraft_rows = {}
+
+# Records file of the current hour, kept open between polls
+records_handle = None
+records_writer = None
+
+# Per-aircraft track plots are a debugging aid, turned on in config.ini
+PLOTS = config.getboolean("debug", "plots", fallback=False)
+
+if PLOTS:
+    # Create directory for plots if it doesn't exist
+    os.makedirs(PLOTS_DIR, exist_ok=True)
+
+# Figure and axes reused by every aircraft plot (created on first use)
+plot_figure = None
+
+# Analyze old aircraft in parallel processes, only worth it with enough
+# of them in the same cycle
+PARALLEL = config.getboolean("processing", "parallel", fallback=False)
+PARALLEL_MIN_AIRCRAFT = 8
+
+# Worker processes for detect_turns (created on first use)
+process_pool = None
 
 API_URL = f"https://api.adsb.lol/v2/lat/{LAT}/lon/{LON}/dist/{RADIUS}"
 """
@@ -44,6 +101,30 @@ example :
 curl -X 'GET' 'https://api.adsb.lol/v2/lat/48.6058/lon/2.6717/dist/5' -H 'accept: application/json'
 """
 
+# Fields read for each aircraft of an API answer
+AC_FIELDS = (
+    "flight",  # callsign, ex: JAL924
+    "r",  # registration, ex: F-GSEX
+    "hex",
+    "alt_baro",  # ft
+    "lat",
+    "lon",
+    "track",  # aircraft own track in degrees
+)
+
+# Keep the HTTPS connection to the API alive between polls
+# Short retries on connection errors rather than losing the whole poll.
+# A read timeout is not retried (the API got the request but is slow):
+# worst case 3 x 3 s to connect + backoff + 10 s to read, within DELAY
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/json"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.3)
+))
+atexit.register(SESSION.close)
+
 logging.basicConfig(
     level=logging.ERROR,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -53,34 +134,67 @@ logging.basicConfig(
     ]
 )
 
-def save_to_records(row):
-    with open(RECORDS_FILE, "a", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(row)
+def records_file(timestamp):
+    """Path of the hourly records file for an ISO timestamp"""
+    return os.path.join(RECORDS_DIR, f"{timestamp[:13]}.csv")
 
-def check_aircraft():
+def save_to_records(rows):
+    """
+    Append all rows of a polling cycle to their records file in one write,
+    and add them to the rows of their aircraft
     """
-    Add a record in the csv file if aircraft(s) found
+    global records_handle, records_writer
+
+    file_path = records_file(rows[0][0])  # Rows of a poll share a timestamp
+    # The file is only reopened when the hour changes
+    if records_handle is None or records_handle.name != file_path:
+        close_records()
+        new_file = not os.path.exists(file_path)
+        records_handle = open(file_path, "a", newline="")
+        records_writer = csv.writer(records_handle)
+        if new_file:
+            records_writer.writerow(list(RECORDS_DTYPES))
+    records_writer.writerows(rows)
+    records_handle.flush()
+    for row in rows:
+        aircraft_rows.setdefault(row[3], []).append(row)  # Keyed by hex
+
+def close_records():
+    """Close the records file currently appended to, if any"""
+    global records_handle
+
+    if records_handle is not None:
+        records_handle.close()
+        records_handle = None
+
+atexit.register(close_records)
+
+def delete_old_records(current_time):
+    """Delete the records files older than RECORDS_RETENTION"""
+    oldest_kept = records_file((current_time - RECORDS_RETENTION).isoformat())
+    for file_name in os.listdir(RECORDS_DIR):
+        file_path = os.path.join(RECORDS_DIR, file_name)
+        if file_path < oldest_kept:
+            os.remove(file_path)
+
+def fetch_aircraft():
+    """
+    Poll the API for aircraft within the altitude band.
+    Only does network I/O, so it can run in a worker thread.
 
     Returns:
-        bool: True if aircraft(s) found
+        list: Rows for the records files (empty on API error)
     """
-    now = datetime.now()
-    timestamp = now.replace(microsecond=0).isoformat()
+    timestamp = datetime.now().isoformat(timespec='seconds')
 
+    rows = []
     try:
-        response = requests.get(API_URL, timeout=10)
+        response = SESSION.get(API_URL, timeout=(3, 10))
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)  # Parsed from bytes, no decoding pass
 
         for ac in data.get("ac", []):
-            callsign = ac.get("flight")  # ex: JAL924
-            regis = ac.get("r")  # ex: F-GSEX
-            hex = ac.get("hex")
-            alt = ac.get("alt_baro")  # ft
-            lat = ac.get("lat")
-            lon = ac.get("lon")
-            track = ac.get("track")  # aircraft own track in degrees
+            callsign, regis, hex, alt, lat, lon, track = map(ac.get, AC_FIELDS)
             
             if alt:
                 if type(alt) is not int:  # ex "ground"
@@ -99,34 +213,44 @@ def check_aircraft():
                 lon,
                 track,
             ]
-            save_to_records(row)
+            rows.append(row)
 
     except Exception as e:
         logging.error("API error: %s", e)
-        return False
+        return []
+
+    return rows
+
+def records_frame(rows):
+    """
+    Builds a DataFrame of records rows, each column directly with its type
+    instead of a frame of objects converted afterwards
+    (ISO timestamps are parsed by NumPy)
+    """
+    return pd.DataFrame({
+        name: pd.array(values, dtype=dtype) if dtype == "Int32" else np.array(values, dtype=dtype)
+        for (name, dtype), values in zip(RECORDS_DTYPES.items(), zip(*rows))
+    })
 
 def process_aircraft_turns():
     """
     Analyze aircraft tracking data to detect direction changes
     and clean old data.
     """
-    
-    # Read RECORDS_FILE
-    try:
-        df = pd.read_csv(RECORDS_FILE)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"The file {RECORDS_FILE} was not found.")
-    
-    # Convert timestamps to datetime
-    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601')
-
     # Calculate time limit (1 hour ago)
     current_time = datetime.now()
-    one_hour_ago = current_time - timedelta(hours=1)
+    one_hour_ago = (current_time - timedelta(hours=1)).isoformat(timespec='seconds')
     
     # Identify aircraft detected more than an hour ago
-    old_aircraft_mask = df['timestamp'] < one_hour_ago
-    old_aircraft_hex = df[old_aircraft_mask]['hex'].unique()
+    # (only their first row is checked: rows are kept in polling order,
+    # and ISO timestamps of the same format compare like the dates)
+    old_aircraft_hex = []
+    for hex_code, rows in aircraft_rows.items():
+        # Aircraft are added to the dict with their first row, so the
+        # first recent one ends the old ones
+        if rows[0][0] >= one_hour_ago:
+            break
+        old_aircraft_hex.append(hex_code)
     
     print(f"Number of aircraft detected more than an hour ago: {len(old_aircraft_hex)}")
     
@@ -134,37 +258,110 @@ def process_aircraft_turns():
     turns_data = []
     
     # Analyze each old aircraft
+    # (their rows are removed from the state, and one frame is built for
+    # all of them, already grouped by aircraft and sorted by timestamp)
+    old_rows = []
     for hex_code in old_aircraft_hex:
-        aircraft_data = df[df['hex'] == hex_code].sort_values('timestamp').reset_index(drop=True)
-        
-        if len(aircraft_data) < 6:  # Need at least 6 points to detect a turn
-            continue
-            
-        turns = detect_turns(aircraft_data)
+        old_rows.extend(aircraft_rows.pop(hex_code))
+
+    old_aircraft_data = []
+    if old_rows:
+        df_old = records_frame(old_rows)
+        # Filter data with valid track values
+        df_old = df_old[df_old['track'].notna()]
+        for rows in df_old.groupby('hex', sort=False).indices.values():
+            if len(rows) < 6:  # Need at least 6 points to detect a turn
+                continue
+            old_aircraft_data.append(df_old.take(rows))
+
+    # Unwrap the tracks of all old aircraft in one pass
+    if old_aircraft_data:
+        unwrapped_tracks = unwrap_tracks(
+            np.concatenate([data['track'].to_numpy() for data in old_aircraft_data]),
+            [len(data) for data in old_aircraft_data]
+        )
+    else:
+        unwrapped_tracks = []
+
+    # Each aircraft is independent from the others
+    if PARALLEL and len(old_aircraft_data) >= PARALLEL_MIN_AIRCRAFT:
+        results = get_process_pool().map(detect_turns, old_aircraft_data, unwrapped_tracks)
+    else:
+        results = map(detect_turns, old_aircraft_data, unwrapped_tracks)
+    for turns in results:
         turns_data.extend(turns)
     
     # Write turns to TURNS_FILE
     if turns_data:
+        # Format the timestamps of all turns in one call
+        timestamps = np.datetime_as_string(
+            np.array([turn[0] for turn in turns_data]),
+            unit='s'
+        )
+        for turn, timestamp in zip(turns_data, timestamps):
+            turn[0] = timestamp
+
         with open(TURNS_FILE, 'a', newline='') as f:
             writer = csv.writer(f)
-            for turn in turns_data:
-                writer.writerow(turn)
+            writer.writerows(turns_data)
         print(f"Number of turns detected: {len(turns_data)}")
     else:
         print("No turns detected.")
     
-    # Remove old aircraft lines from DataFrame
-    df_cleaned = df[~df['hex'].isin(old_aircraft_hex)]
-    
-    # Rewrite RECORDS_FILE without old aircraft
-    df_cleaned.to_csv(RECORDS_FILE, header=True, index=False)
+    # Records files are never rewritten, old ones are simply deleted
+    delete_old_records(current_time)
+
+def get_process_pool():
+    """
+    Returns the pool of worker processes for detect_turns, created on first use.
+    Workers are spawned, not forked, as the API is polled from another thread.
+    """
+    global process_pool
+
+    if process_pool is None:
+        process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return process_pool
+
+def unwrap_tracks(tracks, lengths):
+    """
+    Unwraps the tracks of several aircraft stored one after the other,
+    to avoid jumps from 360° to 0°.
+
+    Args:
+        tracks (array): Tracks of all aircraft in degrees
+        lengths (list of int): Number of tracks of each aircraft
 
-def detect_turns(aircraft_data):
+    Returns:
+        list of array: Unwrapped tracks of each aircraft
+    """
+    firsts = np.cumsum(lengths) - lengths
+
+    # Each step is brought back to [-180, 180] by a whole number of turns,
+    # directly in degrees, then the steps are summed back
+    # (prepended in the dtype of tracks, so float32 tracks stay float32)
+    steps = np.diff(tracks, prepend=tracks.dtype.type(0))
+    steps -= 360.0 * np.round(steps / 360.0)
+    steps[firsts] = 0.0
+    # (summed over all aircraft joined end to end: accumulated in float64,
+    # so the rounding of the aircraft before does not leak into each track)
+    unwrapped = np.cumsum(steps, dtype=np.float64)
+
+    # Each aircraft starts from its own first track
+    unwrapped += np.repeat(tracks[firsts] - unwrapped[firsts], lengths)
+
+    return np.split(unwrapped, firsts[1:])
+
+def detect_turns(valid_track_data, tracks_unwrapped_degrees):
     """
-    Detects direction changes for a given aircraft using detect_segments_range.
+    Detects direction changes for a given aircraft using segment_bounds.
     
     Args:
-        aircraft_data (DataFrame): Specific aircraft data sorted by timestamp
+        valid_track_data (DataFrame): Specific aircraft data with valid
+                                      tracks, sorted by timestamp
+        tracks_unwrapped_degrees (array): Its tracks, unwrapped
         
     Returns:
         list: List of detected turns
@@ -172,40 +369,35 @@ def detect_turns(aircraft_data):
     turns = []
     
     # Check that we have enough data
-    if len(aircraft_data) < 6:
-        return turns
-    
-    # Filter data with valid track values
-    valid_track_data = aircraft_data.dropna(subset=['track']).reset_index(drop=True)
-    
     if len(valid_track_data) < 6:
         return turns
     
-    # Extract track values
-    tracks = valid_track_data['track'].values
-    
-    # Handle angle discontinuity (0°/360°)
-    # Unwrap angles to avoid jumps from 360° to 0°
-    tracks_unwrapped = np.unwrap(np.radians(tracks))
-    tracks_unwrapped_degrees = np.degrees(tracks_unwrapped)
+    # Extract columns once as arrays (no Series per point afterwards)
+    tracks = valid_track_data['track'].to_numpy()
+    lats = valid_track_data['lat'].to_numpy()
+    lons = valid_track_data['lon'].to_numpy()
+    timestamps = valid_track_data['timestamp'].to_numpy()
+    callsigns = valid_track_data['callsign'].to_numpy()
+    regises = valid_track_data['regis'].to_numpy()
+    hex_code = valid_track_data['hex'].iat[0]
     
     try:
-        print("#####################################")
-
-        print(f"{tracks=}")
-        print(f"{tracks_unwrapped_degrees=}")
-
-        segments = detect_segments_range(
+        # segment_bounds walks the values one by one in Python, where plain
+        # floats are much cheaper to index and compare than NumPy scalars
+        starts, ends = segment_bounds(
             tracks_unwrapped_degrees.tolist(),
             range_width=1.0,
             min_size=3
         )
 
-        print_segments_simple(segments)
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debug:
+            print_segments_simple(starts, ends)
         
-        transitions = extract_transitions(segments)
+        transitions = extract_transitions(starts, ends)
 
-        print(f"{transitions=}")
+        if debug:
+            print(f"{transitions=}")
 
         transitions = filter_transitions(
             transitions,
@@ -213,27 +405,33 @@ def detect_turns(aircraft_data):
             min_angle=3.0
         )
 
-        print(f"{transitions=}")
+        if debug:
+            print(f"{transitions=}")
+
+        # Most aircraft fly straight: nothing to plot nor to estimate
+        if not transitions:
+            return turns
 
         # Generate plot for this aircraft
-        hex_code = valid_track_data['hex'].iloc[0]
-        plot_aircraft_tracks(hex_code, tracks, tracks_unwrapped_degrees, transitions, valid_track_data)
+        if PLOTS:
+            plot_aircraft_tracks(hex_code, tracks, tracks_unwrapped_degrees, transitions, valid_track_data)
         
         # Process transitions 
         for i, j in transitions:
             
             # Estimate turn point (interpolation between i and j)
-            turn_point = estimate_turn_point_from_indices(valid_track_data, i, j)
+            turn_point = estimate_turn_point_from_indices(timestamps, lats, lons, tracks, i, j)
             
             if turn_point:
+                turn_timestamp, turn_lat, turn_lon = turn_point
                 # Create entry for TURNS_FILE
                 turn_entry = [
-                    turn_point['timestamp'].strftime('%Y-%m-%dT%H:%M:%S'),
-                    turn_point['callsign'],
-                    turn_point['regis'],
-                    turn_point['hex'],
-                    turn_point['lat'],
-                    turn_point['lon']
+                    turn_timestamp,  # Formatted when written
+                    callsigns[i],
+                    regises[i],
+                    hex_code,
+                    turn_lat,
+                    turn_lon
                 ]
             
                 turns.append(turn_entry)
@@ -244,7 +442,7 @@ def detect_turns(aircraft_data):
     return turns
 
 
-def detect_segments_range(table, range_width=2, min_size=2):
+def segment_bounds(table, range_width=2, min_size=2):
     """
     Detects segments composed of at least min_size values that fit 
     within a given range width.
@@ -255,186 +453,158 @@ def detect_segments_range(table, range_width=2, min_size=2):
         min_size (int): Minimum size of a segment.
     
     Returns:
-        list of dict: Each dictionary contains:
-                     - 'start': start index of segment
-                     - 'end': end index of segment (inclusive)
-                     - 'values': list of segment values
-                     - 'min': minimum value of segment
-                     - 'max': maximum value of segment
-                     - 'range': range width (max - min)
+        tuple of lists: (starts, ends), inclusive indices of each segment
     """
-    if len(table) < min_size:
-        return []
-    
-    segments = []
+    n = len(table)
+    starts = []
+    ends = []
+    if n < min_size:
+        return starts, ends
+
     i = 0
-    
-    while i < len(table):
+    while i < n:
         # Start a new potential segment
-        segment_start = i
         segment_end = i
-        
+        # A segment only grows to the right until it is closed, so its
+        # running min/max can be updated in O(1) per point
+        min_val = max_val = table[i]
+
         # Extend segment as long as range remains acceptable
-        while segment_end < len(table):
-            # Calculate range of current segment
-            segment_values = table[segment_start:segment_end + 1]
-            min_val = min(segment_values)
-            max_val = max(segment_values)
-            current_range = max_val - min_val
-            
+        while segment_end + 1 < n:
+            value = table[segment_end + 1]
+            if value < min_val:
+                min_val = value
+            elif value > max_val:
+                max_val = value
+
             # If range exceeds limit, stop extension
-            if current_range > range_width:
-                segment_end -= 1  # Return to last valid point
+            if max_val - min_val > range_width:
                 break
-            
+
             segment_end += 1
-        
-        # Adjust segment_end if we reached end of table
-        if segment_end >= len(table):
-            segment_end = len(table) - 1
-        
+
         # Check if segment has minimum required size
-        segment_size = segment_end - segment_start + 1
-        if segment_size >= min_size:
-            segment_values = table[segment_start:segment_end + 1]
-            min_val = min(segment_values)
-            max_val = max(segment_values)
-            
-            segments.append({
-                'start': segment_start,
-                'end': segment_end,
-                'values': segment_values,
-                'min': min_val,
-                'max': max_val,
-                'range': max_val - min_val
-            })
-        
+        if segment_end - i + 1 >= min_size:
+            starts.append(i)
+            ends.append(segment_end)
+
         # Move to next point
         i = segment_end + 1
-    
-    return segments
 
-def print_segments_simple(segments):
+    return starts, ends
+
+def print_segments_simple(starts, ends):
     """
     Displays segments concisely with their indices.
     
     Args:
-        segments (list): List of segments returned by detect_segments_range
+        starts, ends (list): Segment bounds returned by segment_bounds
     """
-    if not segments:
+    if not starts:
         print("No segments found")
         return
     
-    print(f"{len(segments)} segment(s) found:")
-    for i, seg in enumerate(segments):
-        print(f"  Segment {i+1}: indices {seg['start']}-{seg['end']}")
+    print(f"{len(starts)} segment(s) found:")
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        print(f"  Segment {i+1}: indices {start}-{end}")
 
-def extract_transitions(segments):
+def extract_transitions(starts, ends):
     """
     Extracts transitions between consecutive segments.
     
     Args:
-        segments (list): List of segments returned by detect_segments_range
+        starts, ends (list): Segment bounds returned by segment_bounds
     
     Returns:
         list of tuples: Each tuple (i, j) represents a transition where:
                        i = end index of previous segment
                        j = start index of following segment
     """
-    if len(segments) < 2:
-        return []
-    
-    transitions = []
-    
-    for i in range(len(segments) - 1):
-        current_segment = segments[i]
-        next_segment = segments[i + 1]
-        
-        current_end = current_segment['end']
-        next_start = next_segment['start']
-        
-        transitions.append((current_end, next_start))
-    
-    return transitions
+    return list(zip(ends[:-1], starts[1:]))
 
 def filter_transitions(transitions, tracks_unwrapped_degrees, min_angle=3.0):
     """
     Eliminates transitions with angle less than min_angle
     """
-    filtered_transitions = []
+    if not transitions:
+        return []
 
-    for i, j in transitions:
-        angle_diff = abs(tracks_unwrapped_degrees[j] - tracks_unwrapped_degrees[i])
-        if angle_diff >= min_angle:
-            filtered_transitions.append((i, j))
+    # Angles of all transitions in one array operation
+    i_idx, j_idx = np.array(transitions).T
+    angle_diffs = np.abs(tracks_unwrapped_degrees[j_idx] - tracks_unwrapped_degrees[i_idx])
+    keep = angle_diffs >= min_angle
 
-    return filtered_transitions
+    return [transition for transition, kept in zip(transitions, keep) if kept]
 
-def estimate_turn_point_from_indices(aircraft_data, i, j):
+def estimate_turn_point_from_indices(timestamps, lats, lons, tracks, i, j):
     """
     Estimates turn point as intersection point between:
     - Half-line from point i in direction of track at point i
     - Half-line from point j in opposite direction of track at point j
     
-    Plane approximation (2D), with Shapely.
-    """
-    point_i = aircraft_data.iloc[i]
-    point_j = aircraft_data.iloc[j]
+    Plane approximation (2D), intersection solved in closed form.
 
-    lat1, lon1, track1 = point_i['lat'], point_i['lon'], point_i['track']
-    lat2, lon2, track2 = point_j['lat'], point_j['lon'], (point_j['track'] + 180) % 360
+    Args:
+        timestamps, lats, lons, tracks (array): Aircraft columns
+        i, j (int): Indices of the transition
+
+    Returns:
+        tuple: (timestamp, lat, lon) of the turn point
+               (None if the half-lines don't intersect)
+    """
+    lat1, lon1, track1 = lats[i], lons[i], tracks[i]
+    lat2, lon2, track2 = lats[j], lons[j], (tracks[j] + 180) % 360
 
     # Arbitrary length to extend half-lines (in km)
     extension_km = 100
+    # Conversion: 1° lat ≈ 111 km ; 1° lon ≈ 111 * cos(lat)
+    extension_deg = extension_km / 111.0
 
-    def extend(lat, lon, track_deg, extension_km):
-        """
-        Extends a point (lat, lon) in direction `track_deg` over `extension_km` kilometers.
-        Corrects latitude for longitude conversion factor.
-        """
-        angle_rad = math.radians(track_deg)
-
-        # Conversion: 1° lat ≈ 111 km ; 1° lon ≈ 111 * cos(lat)
-        delta_lat = (extension_km / 111.0) * math.cos(angle_rad)
-        delta_lon = (extension_km / (111.0 * math.cos(math.radians(lat)))) * math.sin(angle_rad)
+    # Build two segments (half-lines): start point and (lon, lat) vector
+    # over extension_km in the direction of the track
+    track1_rad = math.radians(track1)
+    track2_rad = math.radians(track2)
 
-        new_lat = lat + delta_lat
-        new_lon = lon + delta_lon
-        return (new_lon, new_lat)
-
-    # Build two segments (half-lines)
     p1 = (lon1, lat1)
-    p2 = extend(lat1, lon1, track1, extension_km)
+    dx1 = extension_deg * math.sin(track1_rad) / math.cos(math.radians(lat1))
+    dy1 = extension_deg * math.cos(track1_rad)
 
     q1 = (lon2, lat2)
-    q2 = extend(lat2, lon2, track2, extension_km)
+    dx2 = extension_deg * math.sin(track2_rad) / math.cos(math.radians(lat2))
+    dy2 = extension_deg * math.cos(track2_rad)
 
-    line1 = LineString([p1, p2])
-    line2 = LineString([q1, q2])
+    # Solve p1 + t * (dx1, dy1) = q1 + u * (dx2, dy2) with Cramer's rule,
+    # the segments intersect if both t and u are within [0, 1]
+    denom = dx1 * dy2 - dy1 * dx2
 
-    intersection = line1.intersection(line2)
+    intersects = False
+    if abs(denom) > 1e-12:  # Parallel (or collinear) lines otherwise
+        ex, ey = q1[0] - p1[0], q1[1] - p1[1]
+        t = (ex * dy2 - ey * dx2) / denom
+        u = (ex * dy1 - ey * dx1) / denom
+        intersects = 0.0 <= t <= 1.0 and 0.0 <= u <= 1.0
 
-    if intersection.is_empty or not isinstance(intersection, Point):
+    if not intersects:
         # Fallback: we'll ignore this intersection
-        print(f"[Fallback] i={i}, j={j}")
-        print(f"  Point i: lat={lat1}, lon={lon1}, track={track1}")
-        print(f"  Point j: lat={lat2}, lon={lon2}, track(opposite)={track2}")
-        print(f"  Line1: {p1} -> {p2}")
-        print(f"  Line2: {q1} -> {q2}")
-        plot_debug(p1, p2, q1, q2)
-        return False
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            p2 = (lon1 + dx1, lat1 + dy1)
+            q2 = (lon2 + dx2, lat2 + dy2)
+            print(f"[Fallback] i={i}, j={j}")
+            print(f"  Point i: lat={lat1}, lon={lon1}, track={track1}")
+            print(f"  Point j: lat={lat2}, lon={lon2}, track(opposite)={track2}")
+            print(f"  Line1: {p1} -> {p2}")
+            print(f"  Line2: {q1} -> {q2}")
+            plot_debug(p1, p2, q1, q2)
+        return None
     
     else:
-        lon_mid, lat_mid = intersection.x, intersection.y
+        lon_mid, lat_mid = p1[0] + t * dx1, p1[1] + t * dy1
 
-    turn_point = {
-        'timestamp': point_i['timestamp'] + (point_j['timestamp'] - point_i['timestamp']) / 2,
-        'callsign': point_i['callsign'],
-        'regis': point_i['regis'],
-        'hex': point_i['hex'],
-        'lat': lat_mid,
-        'lon': lon_mid
-    }
+    turn_point = (
+        timestamps[i] + (timestamps[j] - timestamps[i]) / 2,
+        lat_mid,
+        lon_mid
+    )
 
     return turn_point
 
@@ -446,8 +616,8 @@ def plot_debug(p1, p2, q1, q2, intersection=None):
     plt.plot([p1[0], p2[0]], [p1[1], p2[1]], 'r-', label='Line i (track)')
     plt.plot([q1[0], q2[0]], [q1[1], q2[1]], 'b-', label='Line j (opposite track)')
 
-    if intersection and not intersection.is_empty:
-        plt.plot(intersection.x, intersection.y, 'go', label='Intersection')
+    if intersection is not None:
+        plt.plot(intersection[0], intersection[1], 'go', label='Intersection')
 
     plt.xlabel("Longitude")
     plt.ylabel("Latitude")
@@ -459,16 +629,16 @@ def plot_debug(p1, p2, q1, q2, intersection=None):
 
 def angular_difference(angle1, angle2):
     """
-    Calculates minimum angular difference between two angles (0-360°).
+    Calculates minimum angular difference between two angles (0-360°),
+    without branching, so it also works element-wise on arrays.
     
     Args:
-        angle1, angle2 (float): Angles in degrees
+        angle1, angle2 (float or array): Angles in degrees
         
     Returns:
-        float: Minimum angular difference
+        float or array: Minimum angular difference
     """
-    diff = abs(angle1 - angle2)
-    return min(diff, 360 - diff)
+    return np.abs((np.subtract(angle1, angle2) + 180.0) % 360.0 - 180.0)
 
 def plot_aircraft_tracks(hex_code, tracks, tracks_unwrapped_degrees, transitions, aircraft_data):
     """
@@ -482,8 +652,14 @@ def plot_aircraft_tracks(hex_code, tracks, tracks_unwrapped_degrees, transitions
         transitions (list): List of (i, j) transition tuples
         aircraft_data (DataFrame): Complete aircraft data
     """
-    # Create figure with 2 subplots
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    global plot_figure
+
+    # Create figure with 2 subplots once, then only clear its axes
+    if plot_figure is None:
+        plot_figure = plt.subplots(2, 1, figsize=(12, 10))
+    fig, (ax1, ax2) = plot_figure
+    ax1.clear()
+    ax2.clear()
     
     # Plot 1: Original tracks
     ax1.plot(range(len(tracks)), tracks, 'b-o', markersize=4, linewidth=1, label='Original track')
@@ -524,46 +700,34 @@ def plot_aircraft_tracks(hex_code, tracks, tracks_unwrapped_degrees, transitions
                         arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
     
     # Add general information
-    callsign = aircraft_data['callsign'].iloc[0] if not aircraft_data['callsign'].isnull().all() else 'N/A'
-    regis = aircraft_data['regis'].iloc[0] if not aircraft_data['regis'].isnull().all() else 'N/A'
+    callsign = aircraft_data['callsign'].iat[0] if not aircraft_data['callsign'].isnull().all() else 'N/A'
+    regis = aircraft_data['regis'].iat[0] if not aircraft_data['regis'].isnull().all() else 'N/A'
     
     fig.suptitle(f'Aircraft Analysis - {hex_code}\nCallsign: {callsign} | Registration: {regis}\nTransitions detected: {len(transitions)}', 
                  fontsize=14, fontweight='bold')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Get timestamp of aircraft's first point
-    first_timestamp = aircraft_data['timestamp'].iloc[0]
+    first_timestamp = aircraft_data['timestamp'].iat[0]
     # Format timestamp for filename (replace non-allowed characters)
     timestamp_str = first_timestamp.strftime('%Y%m%d_%H%M%S')
     
     # Create filename: timestamp-hex_code.png
     filename = os.path.join(PLOTS_DIR, f'{timestamp_str}-{hex_code}.png')
     
-    # Save plot
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    plt.close()  # Close figure to free memory
+    # Save plot (the figure is kept open to be reused by the next aircraft)
+    fig.savefig(filename, dpi=100)
     
     print(f"📊 Plot saved: {filename}")
 
 def setup_csv_files():
-    records_header = [
-        "timestamp",
-        "callsign",
-        "regis",
-        "hex",
-        "alt",
-        "lat",
-        "lon",
-        "track",
-    ]
-
-    with open(RECORDS_FILE, "w", newline="") as f:
-        # w mode will overwrite the RECORDS_FILE on purpose
+    os.makedirs(RECORDS_DIR, exist_ok=True)
+    for file_name in os.listdir(RECORDS_DIR):
+        # Records of a previous run are deleted on purpose
         # This is to avoid discontinuities in tracking
         #   that would generate fake turns
-        writer = csv.writer(f)
-        writer.writerow(records_header)
+        os.remove(os.path.join(RECORDS_DIR, file_name))
 
     turns_header = [
         "timestamp",
@@ -589,7 +753,15 @@ if __name__ == "__main__":
     )
     print("Leave this code running at least one hour to detect turns.")
 
-    while True:
-        check_aircraft()
-        process_aircraft_turns()
-        time.sleep(DELAY)
\ No newline at end of file
+    # Poll the API in a worker thread while turns are processed,
+    # records are only written from the main thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            cycle_start = time.monotonic()
+            polling = executor.submit(fetch_aircraft)
+            process_aircraft_turns()
+            rows = polling.result()
+            if rows:
+                save_to_records(rows)
+            # No sleep if the cycle already took longer than DELAY
+            time.sleep(max(0, DELAY - (time.monotonic() - cycle_start)))
\ No newline at end of file
@@ -1,8 +1,20 @@
 import json
-import csv
+import argparse
+import pandas as pd
 import folium
 from folium import plugins
+from branca.element import MacroElement
+from jinja2 import Template
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses the resources files faster, but is optional
+# (its JSONDecodeError is a json.JSONDecodeError)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 TURNS_FILE = 'turns.csv'
 RADIONAVS_FILE = 'resources/radionavs.json'
@@ -10,27 +22,70 @@ WAYPOINTS_FILE = 'resources/waypoints.json'
 
 OUTPUT_FILE = 'navigation_map.html'
 
+FR24_AIRCRAFT_URL = 'https://www.flightradar24.com/data/aircraft/'
+
+# Columns of TURNS_FILE, as written by main.py
+TURNS_COLUMNS = ['timestamp', 'callsign', 'registration', 'icao24', 'latitude', 'longitude']
+TURNS_DTYPES = {
+    'timestamp': str,
+    'callsign': str,
+    'registration': str,
+    'icao24': str,
+    'latitude': 'float64',
+    'longitude': 'float64',
+}
+
+class CircleMarkers(MacroElement):
+    """
+    Circle markers created by a single script looping over their data,
+    instead of one folium element (and one template render) per marker.
+
+    Args:
+        points (list): [latitude, longitude, label, details] of each marker,
+                       the label is the tooltip and starts the popup,
+                       details (optional) end the popup
+        **options: Leaflet circleMarker options
+    """
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }}_points = {{ this.points }};
+            {{ this.get_name() }}_points.forEach(function (p) {
+                L.circleMarker([p[0], p[1]], {{ this.options }})
+                    .bindPopup(p.length > 3 ? p[2] + p[3] : p[2])
+                    .bindTooltip(p[2], {sticky: true})
+                    .addTo({{ this._parent.get_name() }});
+            });
+        {% endmacro %}
+    """)
+
+    def __init__(self, points, **options):
+        super().__init__()
+        self._name = 'CircleMarkers'
+        # Embedded in a <script> block: a '</' in a label must not close it
+        self.points = json.dumps(points).replace('</', '<\\/')
+        self.options = json.dumps(options)
+
 def load_csv_data(file_path):
-    """Load data from a CSV file"""
+    """Load data from a CSV file (parsed by the pandas C parser)"""
     try:
-        turns = []
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            try:
-                next(reader)  # Skip the header
-            except StopIteration:
-                raise ValueError(f"The file {file_path} is empty.")
-            for row in reader:
-                if len(row) >= 6:
-                    turns.append({
-                        'timestamp': row[0],
-                        'callsign': row[1].strip(),
-                        'registration': row[2],
-                        'icao24': row[3],
-                        'latitude': float(row[4]),
-                        'longitude': float(row[5])
-                    })
-        if not turns:
+        # No header line to skip
+        if Path(file_path).stat().st_size == 0:
+            raise ValueError(f"The file {file_path} is empty.")
+        turns = pd.read_csv(
+            file_path,
+            header=0,  # Skip the header
+            names=TURNS_COLUMNS,
+            usecols=range(len(TURNS_COLUMNS)),
+            dtype=TURNS_DTYPES,
+            keep_default_na=False,
+            # Missing fields of short rows, skipped below
+            na_values={'latitude': [''], 'longitude': ['']},
+            engine='c'
+        )
+        turns['callsign'] = turns['callsign'].str.strip()
+        # Rows with missing fields
+        turns = turns.dropna(subset=['latitude', 'longitude'])
+        if turns.empty:
             raise ValueError(f"The file {file_path} contains no valid data.")
         return turns
     except FileNotFoundError:
@@ -40,68 +95,110 @@ def load_csv_data(file_path):
             raise e
         else:
             raise ValueError(f"Invalid data format in {file_path}.")
-    except IndexError:
-        raise ValueError(f"Invalid data format in {file_path}.")
 
 def load_json_data(file_path):
-    """Load data from a JSON file"""
+    """Load data from a JSON file (parsed again only if it was modified)"""
+    try:
+        mtime = Path(file_path).stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return load_json_file(file_path, mtime)
+
+@lru_cache(maxsize=8)
+def load_json_file(file_path, mtime):
+    """Parse a JSON file, cached by path and modification time"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Parsed from bytes, no decoding pass
+        return json_loads(Path(file_path).read_bytes())
     except FileNotFoundError:
         return []
     except json.JSONDecodeError:
         return []
 
-def create_map_with_points():
-    """Create a Leaflet map with colored points"""
+def create_map_with_points(with_measure=False):
+    """
+    Create a Leaflet map with colored points
+
+    Args:
+        with_measure (bool): Add the measure control (its JS and CSS
+                             are only embedded when asked for)
+    """
     
-    # Load data
-    turns = load_csv_data(TURNS_FILE)
-    radionavs = load_json_data(RADIONAVS_FILE)
-    waypoints = load_json_data(WAYPOINTS_FILE)
+    # Load data (the three files are independent, read them concurrently)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        turns_future = executor.submit(load_csv_data, TURNS_FILE)
+        radionavs_future = executor.submit(load_json_data, RADIONAVS_FILE)
+        waypoints_future = executor.submit(load_json_data, WAYPOINTS_FILE)
+    turns = turns_future.result()
+    radionavs = radionavs_future.result()
+    waypoints = waypoints_future.result()
     
     # Calculate map center based on turns points
-    center_lat = sum(point['latitude'] for point in turns) / len(turns)
-    center_lon = sum(point['longitude'] for point in turns) / len(turns)
+    # (one NumPy reduction over both columns)
+    center_lat, center_lon = turns[['latitude', 'longitude']].to_numpy().mean(axis=0)
     
     # Create the map
+    # (markers drawn on one canvas instead of one SVG node each)
     m = folium.Map(
         location=[center_lat, center_lon],
         zoom_start=6,
-        tiles='OpenStreetMap'
+        tiles='OpenStreetMap',
+        prefer_canvas=True
     )
 
     # Add red points for aircraft (turns)
-    for turn in turns:
-        folium.CircleMarker(
-            location=[turn['latitude'], turn['longitude']],
-            radius=6,
-            popup=f"Aircraft: {turn['callsign']}<br>Registration: <a href=\"https://www.flightradar24.com/data/aircraft/{turn['registration']}\" target=\"_blank\" >{turn['registration']}</a><br>Time: {turn['timestamp']}",
-            tooltip=f"Aircraft: {turn['callsign']}",
-            color='red',
-        ).add_to(m)
+    # (columns zipped as plain lists, no row object per turn)
+    CircleMarkers(
+        [
+            [
+                latitude,
+                longitude,
+                f"Aircraft: {callsign}",
+                f"<br>Registration: <a href=\"{FR24_AIRCRAFT_URL}{registration}\" target=\"_blank\" >{registration}</a><br>Time: {timestamp}",
+            ]
+            for latitude, longitude, callsign, registration, timestamp in zip(
+                turns['latitude'].tolist(),
+                turns['longitude'].tolist(),
+                turns['callsign'].tolist(),
+                turns['registration'].tolist(),
+                turns['timestamp'].tolist()
+            )
+        ],
+        radius=6,
+        color='red',
+        fill=False
+    ).add_to(m)
 
-    # Add blue points for radionavs
-    for radionav in radionavs:
-        folium.CircleMarker(
-            location=[radionav['latitude'], radionav['longitude']],
+    # Add blue points for radionavs (if any, no empty script otherwise)
+    if radionavs:
+        CircleMarkers(
+            [
+                [
+                    radionav['latitude'],
+                    radionav['longitude'],
+                    f"Radionav: {radionav['code']}",
+                ]
+                for radionav in radionavs
+            ],
             radius=3,
-            popup=f"Radionav: {radionav['code']}",
-            tooltip=f"Radionav: {radionav['code']}",
             color='blue',
             fill=True,
             fillColor='blue',
             fillOpacity=0.7
         ).add_to(m)
     
-    # Add green points for waypoints
-    for waypoint in waypoints:
-        folium.CircleMarker(
-            location=[waypoint['latitude'], waypoint['longitude']],
+    # Add green points for waypoints (if any)
+    if waypoints:
+        CircleMarkers(
+            [
+                [
+                    waypoint['latitude'],
+                    waypoint['longitude'],
+                    f"Waypoint: {waypoint['code']}",
+                ]
+                for waypoint in waypoints
+            ],
             radius=3,
-            popup=f"Waypoint: {waypoint['code']}",
-            tooltip=f"Waypoint: {waypoint['code']}",
             color='green',
             fill=True,
             fillColor='green',
@@ -109,20 +206,21 @@ def create_map_with_points():
         ).add_to(m)
 
     # Add a legend
-    legend_html = '''
+    legend_html = f'''
     <div style="position: fixed; 
                 bottom: 30px; left: 30px; width: 170px; height: 106px; 
                 background-color: white; border:2px solid grey; z-index:9999; 
                 font-size:14px; padding: 10px">
-    <p><span style="color:red;">●</span> Turns ('''+str(len(turns))+''')</p>
-    <p><span style="color:blue;">●</span> Radionavs ('''+str(len(radionavs))+''')</p>
-    <p><span style="color:green;">●</span> Waypoints ('''+str(len(waypoints))+''')</p>
+    <p><span style="color:red;">●</span> Turns ({len(turns)})</p>
+    <p><span style="color:blue;">●</span> Radionavs ({len(radionavs)})</p>
+    <p><span style="color:green;">●</span> Waypoints ({len(waypoints)})</p>
     </div>
     '''
     m.get_root().html.add_child(folium.Element(legend_html))
     
-    # Add a scale
-    plugins.MeasureControl().add_to(m)
+    # Add the measure control (distances and areas), if asked for
+    if with_measure:
+        plugins.MeasureControl().add_to(m)
 
     # Save the map
     try:
@@ -132,10 +230,18 @@ def create_map_with_points():
         raise Exception(f"Error saving map: {e}")
     
 def main():
+    parser = argparse.ArgumentParser(description="Generate the navigation map of the detected turns")
+    parser.add_argument(
+        '--measure',
+        action='store_true',
+        help="add the measure control (distances and areas) to the map"
+    )
+    args = parser.parse_args()
+
     print("Generating navigation map...")
     
     try:
-        map_obj = create_map_with_points()
+        map_obj = create_map_with_points(with_measure=args.measure)
         
         if map_obj:
             print(f"Map generated successfully in '{OUTPUT_FILE}'.")
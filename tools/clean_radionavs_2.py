@@ -1,140 +1,30 @@
-import pandas as pd
-import re
-import json
+from dms_coordinates import iter_coordinate_chunks, write_coordinates
 
-def dms_to_decimal(dms_string):
-    """
-    Convertit des coordonnées DMS (Degrés Minutes Secondes) en décimal
-    Exemple: "45°39'21.0\"\"N" -> 45.6558333
-    """
-    # Pattern pour extraire degrés, minutes, secondes et direction
-    pattern = r"(\d+)°(\d+)'([\d.]+)\"\"([NSEW])"
-    match = re.match(pattern, dms_string.strip())
-    
-    if not match:
-        return None
-    
-    degrees = float(match.group(1))
-    minutes = float(match.group(2))
-    seconds = float(match.group(3))
-    direction = match.group(4)
-    
-    # Conversion en décimal
-    decimal = degrees + minutes/60 + seconds/3600
-    
-    # Appliquer le signe négatif pour Sud et Ouest
-    if direction in ['S', 'W']:
-        decimal = -decimal
-    
-    return decimal
-
-def parse_coordinates_csv(file_path):
-    """
-    Parse le fichier CSV à 3 colonnes et convertit les coordonnées
-    """
-    data = []
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            print(f"Ligne lue: {line}")
-            
-            if line and ';' in line:
-                # Séparer les trois parties: code, coordonnées, info
-                parts = line.split(';')
-                
-                if len(parts) >= 3:
-                    code = parts[0].strip()
-                    coord_string = parts[1].strip('"')
-                    info = parts[2].strip('"')
-                    
-                    print(f"Code: {code}")
-                    print(f"Coordonnées: {coord_string}")
-                    print(f"Info: {info}")
-                    
-                    # Séparer latitude et longitude
-                    coords = coord_string.split(' ')
-                    if len(coords) == 2:
-                        lat_dms = coords[0]
-                        lon_dms = coords[1]
-                        print(f"Latitude DMS: {lat_dms}")
-                        print(f"Longitude DMS: {lon_dms}")
-                        
-                        # Convertir en décimal
-                        lat_decimal = dms_to_decimal(lat_dms)
-                        lon_decimal = dms_to_decimal(lon_dms)
-                        print(f"Latitude décimal: {lat_decimal}")
-                        print(f"Longitude décimal: {lon_decimal}")
-                        
-                        if lat_decimal is not None and lon_decimal is not None:
-                            data.append({
-                                'code': code,
-                                'latitude': round(lat_decimal, 6),
-                                'longitude': round(lon_decimal, 6),
-                            })
-                            print(f"✓ Ajouté: {code}")
-                        else:
-                            print(f"✗ Erreur conversion: {code}")
-                    else:
-                        print(f"✗ Format coordonnées invalide: {coord_string}")
-                elif len(parts) == 2:
-                    # Cas où il n'y a que 2 colonnes (code et coordonnées)
-                    code = parts[0].strip()
-                    coord_string = parts[1].strip('"')
-                    
-                    coords = coord_string.split(' ')
-                    if len(coords) == 2:
-                        lat_dms = coords[0]
-                        lon_dms = coords[1]
-                        
-                        lat_decimal = dms_to_decimal(lat_dms)
-                        lon_decimal = dms_to_decimal(lon_dms)
-                        
-                        if lat_decimal is not None and lon_decimal is not None:
-                            data.append({
-                                'code': code,
-                                'latitude': round(lat_decimal, 6),
-                                'longitude': round(lon_decimal, 6),
-                                'info': ''
-                            })
-                else:
-                    print(f"✗ Format ligne invalide: {line}")
-            print("-" * 50)
-    
-    return data
-
-def convert_coordinates_file(input_file, output_json=None, output_csv=None):
+def convert_coordinates_file(input_file, output_json=None, output_csv=None, verbose=False):
     """
     Fonction principale pour convertir le fichier
+    (les coordonnées sont sauvegardées bloc par bloc, le résumé est renvoyé)
+    verbose: résumé de chaque conversion (logging au niveau DEBUG)
     """
     print(f"Traitement du fichier: {input_file}")
     print("=" * 60)
     
-    # Parser les données
-    data = parse_coordinates_csv(input_file)
+    # Parser les données et les sauvegarder en JSON / CSV si demandé
+    summary = write_coordinates(
+        iter_coordinate_chunks(input_file, verbose=verbose),
+        output_json=output_json,
+        output_csv=output_csv
+    )
     
     print("=" * 60)
-    print(f"Traité {len(data)} coordonnées")
+    print(f"Traité {summary['count']} coordonnées")
     
-    # Afficher un résumé
-    if data:
-        print("\nRésumé des conversions:")
-        for item in data:
-            print(f"{item['code']}: {item['latitude']}, {item['longitude']}")
-    
-    # Sauvegarder en JSON si demandé
     if output_json:
-        with open(output_json, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"\nJSON sauvegardé: {output_json}")
-    
-    # Sauvegarder en CSV si demandé
     if output_csv:
-        df = pd.DataFrame(data)
-        df.to_csv(output_csv, index=False, encoding='utf-8')
         print(f"CSV sauvegardé: {output_csv}")
     
-    return data
+    return summary
 
 # Test avec vos données d'exemple
 test_data = '''ABB;"50°08'06.5""N 001°51'16.9""E";"60NM FL500"
@@ -168,20 +58,21 @@ if __name__ == "__main__":
     input_file = 'radio_clean.csv'
     
     # Convertir et sauvegarder
-    data = convert_coordinates_file(
+    summary = convert_coordinates_file(
         input_file, 
         output_json='coordinates_decimal.json',
         output_csv='coordinates_decimal.csv'
     )
     
-    # Créer aussi un DataFrame pandas pour manipulation
-    if data:
-        df = pd.DataFrame(data)
-        print(f"\nDataFrame créé avec {len(df)} lignes")
-        print(df.head())
+    # Premières lignes et statistiques, calculées bloc par bloc
+    if summary['count']:
+        print("\nPremières coordonnées:")
+        print(summary['head'])
         
         # Afficher les statistiques
+        latitude_min, latitude_max = summary['latitude']
+        longitude_min, longitude_max = summary['longitude']
         print(f"\nStatistiques:")
-        print(f"- Codes uniques: {df['code'].nunique()}")
-        print(f"- Latitude min/max: {df['latitude'].min():.6f} / {df['latitude'].max():.6f}")
-        print(f"- Longitude min/max: {df['longitude'].min():.6f} / {df['longitude'].max():.6f}")
+        print(f"- Codes uniques: {len(summary['codes'])}")
+        print(f"- Latitude min/max: {latitude_min:.6f} / {latitude_max:.6f}")
+        print(f"- Longitude min/max: {longitude_min:.6f} / {longitude_max:.6f}")
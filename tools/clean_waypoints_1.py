@@ -1,23 +1,41 @@
-import pandas as pd
 import re
 
-def clean_csv_coordinates(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Remplacer les retours à la ligne entre les coordonnées par un espace
-    # Pattern: trouve les coordonnées Nord suivies d'un retour à la ligne et des coordonnées Est/Ouest
-    pattern = r'([0-9]+°[0-9]+\'[0-9]+\.[0-9]+""[NS])\s*\n\s*([0-9]+°[0-9]+\'[0-9]+\.[0-9]+""[EW])'
-    cleaned_content = re.sub(pattern, r'\1 \2', content)
-    
-    return cleaned_content
+# Remplacer les retours à la ligne entre les coordonnées par un espace
+# Fin de ligne : coordonnées Nord/Sud, début de la ligne suivante : coordonnées Est/Ouest
+# (compilés une seule fois)
+_END_NS = re.compile(r'[0-9]+°[0-9]+\'[0-9]+\.[0-9]+""[NS]$')
+_START_EW = re.compile(r'^[0-9]+°[0-9]+\'[0-9]+\.[0-9]+""[EW]')
 
-# Nettoyer et lire le fichier
-cleaned_csv = clean_csv_coordinates('waypoints.csv')
+def iter_cleaned_lines(lines):
+    """
+    Renvoie les lignes en joignant les coordonnées coupées
+    (une seule ligne en attente, le fichier n'est jamais chargé en entier)
+    """
+    prev = None
+    for line in lines:
+        if prev is not None and _END_NS.search(prev.rstrip()):
+            if not line.strip():
+                # Ligne vide entre les deux coordonnées
+                prev = prev.rstrip() + '\n'
+                continue
+            if _START_EW.match(line.lstrip()):
+                prev = prev.rstrip() + ' ' + line.lstrip()
+                continue
+        if prev is not None:
+            yield prev
+        prev = line
+    if prev is not None:
+        yield prev
 
-# Sauvegarder le fichier nettoyé
-with open('fichier_nettoye.csv', 'w', encoding='utf-8') as f:
-    f.write(cleaned_csv)
+def clean_csv_coordinates(file_path, output_path):
+    """
+    Recopie le fichier ligne par ligne en joignant les coordonnées coupées
+    """
+    with open(file_path, 'r', encoding='utf-8') as f, \
+         open(output_path, 'w', encoding='utf-8') as out:
+        out.writelines(iter_cleaned_lines(f))
 
-# Maintenant lire avec pandas
-df = pd.read_csv('fichier_nettoye.csv', sep=';', header=None, names=['Code', 'Coordinates'])
+# (clean_waypoints_2.py importe iter_cleaned_lines sans passer par le fichier nettoyé)
+if __name__ == "__main__":
+    # Nettoyer le fichier et sauvegarder le fichier nettoyé
+    clean_csv_coordinates('waypoints.csv', 'fichier_nettoye.csv')
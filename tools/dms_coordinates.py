@@ -0,0 +1,201 @@
+import pandas as pd
+import logging
+import os
+from contextlib import ExitStack
+
+# Lecture et conversion des fichiers de coordonnées DMS,
+# communes à clean_radionavs_2.py et clean_waypoints_2.py
+
+log = logging.getLogger(__name__)
+
+# Directions des coordonnées négatives
+_NEG = frozenset(('S', 'W'))
+
+# Nombre de lignes lues et converties à la fois
+CHUNK_SIZE = 100_000
+
+# Coordonnées "LAT LON" d'une ligne (les "" du fichier sont déjà
+# ramenés à " par pandas, les espaces autour sont ignorés par le pattern)
+DMS_PAIR_PATTERN = r"^\s*(\d+)°(\d+)'([\d.]+)\"([NS])\s+(\d+)°(\d+)'([\d.]+)\"([EW])\s*$"
+
+class LinesReader:
+    """
+    Objet fichier en lecture sur un itérable de lignes (un générateur par
+    exemple), que pd.read_csv lit bloc par bloc sans le charger en entier
+    """
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._buffer = ''
+
+    def read(self, size=-1):
+        # Lignes tirées du générateur jusqu'à avoir size caractères
+        parts, length = [self._buffer], len(self._buffer)
+        while size is None or size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            parts.append(line)
+            length += len(line)
+        data = ''.join(parts)
+        if size is None or size < 0:
+            self._buffer = ''
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+    def __iter__(self):
+        if self._buffer:
+            buffer, self._buffer = self._buffer, ''
+            yield buffer
+        yield from self._lines
+
+def dms_columns_to_decimal(degrees, minutes, seconds, direction):
+    """
+    Convertit des colonnes DMS (Degrés Minutes Secondes) en décimal
+    Exemple: 45, 39, 21.0, N -> 45.6558333
+    """
+    # Multiplications par des constantes plutôt que divisions
+    decimal = degrees.astype(float) + minutes.astype(float)*(1/60) + seconds.astype(float)*(1/3600)
+
+    # Appliquer le signe négatif pour Sud et Ouest
+    return decimal.where(~direction.isin(_NEG), -decimal)
+
+def iter_coordinate_chunks(file_path, verbose=False):
+    """
+    Parse le fichier CSV (CODE;"LAT LON"[;INFO]) et convertit les coordonnées
+    (vectorisé avec pandas, un DataFrame converti par bloc de CHUNK_SIZE lignes)
+    file_path: chemin ou objet fichier (LinesReader par exemple)
+    verbose: détail des lignes ignorées et des conversions (logging au niveau DEBUG)
+    """
+    if verbose:
+        logging.basicConfig(level=logging.DEBUG)
+
+    # Lire le fichier par blocs de CHUNK_SIZE lignes (Info ignorée si présente),
+    # un seul bloc en mémoire à la fois
+    try:
+        chunks = pd.read_csv(
+            file_path,
+            sep=';',
+            header=None,
+            names=['code', 'coord'],
+            usecols=[0, 1],
+            quotechar='"',
+            dtype=str,
+            engine='c',
+            chunksize=CHUNK_SIZE
+        )
+        for chunk in chunks:
+            yield convert_chunk(chunk)
+    except pd.errors.EmptyDataError:
+        # Fichier vide : aucune coordonnée
+        return
+
+def convert_chunk(df):
+    """
+    Convertit les coordonnées d'un bloc de lignes (colonnes code et coord)
+    """
+    # Extraire degrés, minutes, secondes et direction de la latitude
+    # et de la longitude, pour toutes les lignes du bloc
+    parts = df['coord'].str.extract(DMS_PAIR_PATTERN)
+    latitude = dms_columns_to_decimal(parts[0], parts[1], parts[2], parts[3])
+    longitude = dms_columns_to_decimal(parts[4], parts[5], parts[6], parts[7])
+
+    data = pd.DataFrame({
+        'code': df['code'].str.strip(),
+        'latitude': latitude,
+        'longitude': longitude,
+    })
+
+    # Ignorer les lignes dont les coordonnées n'ont pas pu être converties
+    invalid = data['latitude'].isna() | data['longitude'].isna()
+    if log.isEnabledFor(logging.DEBUG):
+        for code, coord in zip(data['code'][invalid], df['coord'][invalid]):
+            log.debug("Coordonnées invalides pour %s: %s", code, coord)
+    return data[~invalid]
+
+def write_coordinates(chunks, output_json=None, output_csv=None):
+    """
+    Sauvegarde les coordonnées au fur et à mesure des blocs, en JSON
+    (liste de {code, latitude, longitude}) et/ou en CSV (code,latitude,longitude)
+    Renvoie un résumé : nombre de coordonnées, premières lignes, codes
+    uniques, latitude et longitude min/max
+    Les fichiers sont écrits à côté (.tmp) et ne remplacent les fichiers
+    existants qu'une fois toutes les coordonnées écrites
+    """
+    summary = {'count': 0, 'head': None, 'codes': set(), 'latitude': None, 'longitude': None}
+    outputs = [path for path in (output_json, output_csv) if path]
+
+    try:
+        write_coordinate_files(chunks, summary, output_json, output_csv)
+    except BaseException:
+        # Fichier introuvable, erreur de lecture... : les fichiers existants sont gardés
+        for path in outputs:
+            if os.path.exists(path + '.tmp'):
+                os.remove(path + '.tmp')
+        raise
+
+    for path in outputs:
+        os.replace(path + '.tmp', path)
+
+    return summary
+
+def write_coordinate_files(chunks, summary, output_json=None, output_csv=None):
+    """
+    Ecrit les blocs dans output_json.tmp et output_csv.tmp, et met à jour summary
+    """
+    with ExitStack() as stack:
+        json_file = stack.enter_context(open(output_json + '.tmp', 'w', encoding='utf-8')) if output_json else None
+        csv_file = stack.enter_context(open(output_csv + '.tmp', 'w', encoding='utf-8', newline='')) if output_csv else None
+
+        if csv_file:
+            csv_file.write("code,latitude,longitude\n")
+        json_separator = '[\n  '
+
+        for data in chunks:
+            if data.empty:
+                continue
+
+            if log.isEnabledFor(logging.DEBUG):
+                for item in data.itertuples(index=False):
+                    log.debug("%s: %s, %s", item.code, item.latitude, item.longitude)
+
+            if json_file:
+                # Encodeur JSON C de pandas, sans liste de dicts intermédiaire
+                # (arrondi à 6 décimales à l'écriture), les objets du bloc
+                # sont ajoutés au tableau JSON du fichier
+                records = data.to_json(orient='records', indent=2, force_ascii=False, double_precision=6)
+                json_file.write(json_separator + records[1:-1].strip())
+                json_separator = ',\n  '
+
+            if csv_file:
+                # Lignes formatées directement (codes sans virgule ni guillemet),
+                # sans le writer CSV de pandas
+                csv_file.writelines(
+                    f"{code},{latitude:.6f},{longitude:.6f}\n"
+                    for code, latitude, longitude in zip(
+                        data['code'].tolist(),
+                        data['latitude'].tolist(),
+                        data['longitude'].tolist()
+                    )
+                )
+
+            # Résumé (directement sur les tableaux NumPy des colonnes)
+            if summary['head'] is None:
+                summary['head'] = data.head()
+            summary['count'] += len(data)
+            summary['codes'].update(data['code'].tolist())
+            summary['latitude'] = extend_range(summary['latitude'], data['latitude'].to_numpy())
+            summary['longitude'] = extend_range(summary['longitude'], data['longitude'].to_numpy())
+
+        if json_file:
+            # Tableau vide si aucune coordonnée
+            json_file.write('[]' if summary['count'] == 0 else '\n]')
+
+def extend_range(current, values):
+    """
+    (min, max) de current étendu aux valeurs d'un tableau NumPy non vide
+    """
+    low, high = values.min(), values.max()
+    if current is None:
+        return low, high
+    return min(current[0], low), max(current[1], high)